@@ -4,17 +4,25 @@ import numpy as np
 from weather_api import WeatherDataCollector
 import time
 
+from path_finding import PathFinder
+from map import positions, connections, zone_locations
+
 collector = WeatherDataCollector()
 city = "Singapore"
-print(f"\nFetching weather data for {city}...")
-weather_data = collector.get_weather_data(city)
+print(f"\nFetching weather data for {city} and {len(zone_locations)} zones...")
+# Global city and zone locations are fetched in one concurrent batch
+zone_weather, zone_errors = collector.get_zone_weather({"global": city, **zone_locations})
 # Interpret rain_chance & uv_index in range [0, 1]
-rain_chance, uv_index = collector.process_weather_metrics(weather_data)
+if "global" in zone_weather:
+    rain_chance, uv_index = zone_weather.pop("global")
+else:
+    rain_chance, uv_index = 0.0, 0.0  # Neutral defaults so routing still works offline
+    print(f"Failed to fetch weather data for {city}, using no rain / low UV: {zone_errors.pop('global').message}")
 print(rain_chance, uv_index)
-from path_finding import PathFinder
+for zone, error in zone_errors.items():
+    print(f"Zone {zone} falls back to global weather: {error.message}")
 
 map_image = cv2.imread("NTU_minimap.png")
-from map import positions, connections
 finder = PathFinder(positions, connections)
 
 # vis_map = finder.visualize(map_image)
@@ -89,6 +97,13 @@ class WeatherControlPanel:
         # Draw slider values
         cv2.putText(self.img, f"UV Index: {self.get_uv_text()}", (250, 280), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
         cv2.putText(self.img, f"Rain Chance: {self.rain_chance:.2%}", (250, 320), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+        if self.mode:
+            # Outdoor paths are priced per zone; the sliders only apply to zones without data
+            cv2.putText(self.img, "Zone weather:", (250, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+            for i, (zone, (zone_rain, zone_uv)) in enumerate(sorted(zone_weather.items())):
+                cv2.putText(self.img, f"{zone}: Rain {zone_rain:.0%}, UV {zone_uv:.2f}", (250, 70 + 30 * i),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+            cv2.putText(self.img, "Fallback for zones without data:", (250, 250), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
         cv2.imshow(self.window_name, self.img)
         #################
         ## Weather API ##
@@ -104,7 +119,8 @@ class WeatherControlPanel:
         finder.sunny_weight = 2.0 if self.avoid_sun else 0.0
         finder.road_crossing_weight = 4.0 if self.avoid_road else 0.0
         # Find optimal path
-        self.path, self.cost = finder.find_shortest_path(0, 22, self.rain_chance, self.uv_index/3.0)
+        self.path, self.cost = finder.find_shortest_path(0, 22, self.rain_chance, self.uv_index/3.0,
+                                                         zone_weather if self.mode else None)
 
     def handle_click(self, event, x, y, flags, param):
         if event == cv2.EVENT_LBUTTONDOWN:
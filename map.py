@@ -1,5 +1,6 @@
 import numpy as np
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -9,6 +10,7 @@ class Connection:
     is_indoor: bool
     stairs: int  # positive for up, negative for down
     road_crossings: int
+    zone: Optional[str] = None  # weather zone for outdoor paths, None uses the global weather
 positions = np.array([
         [1765, 752],  # 0: Lee Wee Nam Lib
         [1765, 790],  # 1:
@@ -51,39 +53,45 @@ positions = np.array([
         # [508, 554],   # 38
     ])
 
-# Connection(nodeA, nodeB, is_indoor, stair_count, cross_road)
+# Weather zone -> wttr.in location query ("lat,lon")
+zone_locations = {
+    "east": "1.3472,103.6852",  # Lee Wee Nam Lib side
+    "west": "1.3485,103.6777",  # NIE side
+}
+
+# Connection(nodeA, nodeB, is_indoor, stair_count, cross_road, zone)
 connections = [
     Connection(0, 1, True, 0, 0),
     Connection(1, 2, True, 0, 0),
     Connection(2, 3, True, -20, 0),     # Stair from Lee Wee Nam Lib to bus stop
-    Connection(3, 4, False, 0, 0),
-    Connection(4, 5, False, 0, 1),
-    Connection(5, 6, False, 0, 0),
-    Connection(6, 7, False, 0, 1),
-    Connection(7, 8, False, 0, 0),
-    Connection(8, 9, False, 0, 0),
-    Connection(9, 10, False, 0, 0),
-    Connection(10, 11, False, 0, 1),
-    Connection(11, 12, False, 0, 0),
-    Connection(12, 13, False, 0, 0),
-    Connection(13, 14, False, 0, 0),
-    Connection(14, 15, False, 0, 0),
-    Connection(15, 16, False, 0, 0),
-    Connection(16, 17, False, 0, 1),
-    Connection(17, 18, False, 0, 0),
-    Connection(18, 19, False, 0, 1),
-    Connection(19, 20, False, 0, 0),
-    Connection(20, 21, False, 60, 0),   # Stair near NIE Lib
+    Connection(3, 4, False, 0, 0, "east"),
+    Connection(4, 5, False, 0, 1, "east"),
+    Connection(5, 6, False, 0, 0, "east"),
+    Connection(6, 7, False, 0, 1, "east"),
+    Connection(7, 8, False, 0, 0, "west"),
+    Connection(8, 9, False, 0, 0, "west"),
+    Connection(9, 10, False, 0, 0, "west"),
+    Connection(10, 11, False, 0, 1, "west"),
+    Connection(11, 12, False, 0, 0, "west"),
+    Connection(12, 13, False, 0, 0, "west"),
+    Connection(13, 14, False, 0, 0, "west"),
+    Connection(14, 15, False, 0, 0, "west"),
+    Connection(15, 16, False, 0, 0, "west"),
+    Connection(16, 17, False, 0, 1, "west"),
+    Connection(17, 18, False, 0, 0, "west"),
+    Connection(18, 19, False, 0, 1, "west"),
+    Connection(19, 20, False, 0, 0, "west"),
+    Connection(20, 21, False, 60, 0, "west"),   # Stair near NIE Lib
     Connection(21, 22, True, 0, 0),
     Connection(22, 23, True, 0, 0),
     Connection(23, 24, True, 0, 0),
-    Connection(24, 25, False, 0, 0),
+    Connection(24, 25, False, 0, 0, "east"),
     Connection(25, 26, True, -20, 0),  # Stair to NIE
-    Connection(26, 27, False, 0, 0),
-    Connection(27, 28, False, 0, 0),
-    Connection(28, 29, False, 0, 0),
-    Connection(29, 30, False, 0, 0),
-    Connection(30, 31, False, 0, 1),
+    Connection(26, 27, False, 0, 0, "east"),
+    Connection(27, 28, False, 0, 0, "east"),
+    Connection(28, 29, False, 0, 0, "east"),
+    Connection(29, 30, False, 0, 0, "east"),
+    Connection(30, 31, False, 0, 1, "east"),
     Connection(31, 32, True, 0, 0),
     Connection(32, 33, True, 0, 0),
     Connection(33, 1, True, 0, 0),
@@ -11,6 +11,7 @@ class Connection:
     is_indoor: bool
     stairs: int  # positive for up, negative for down
     road_crossings: int
+    zone: Optional[str] = None  # weather zone for outdoor paths, None uses the global weather
 
 
 class PathFinder:
@@ -48,7 +49,8 @@ class PathFinder:
 
         return graph
 
-    def _calculate_cost(self, connection: Connection, rain_prob: float, uv_index: float) -> float:
+    def _calculate_cost(self, connection: Connection, rain_prob: float, uv_index: float,
+                        zone_weather: Optional[Dict[str, Tuple[float, float]]] = None) -> float:
         """
         Calculate the cost of using a connection based on various factors
         """
@@ -60,6 +62,8 @@ class PathFinder:
 
         # Weather effects for outdoor paths
         if not connection.is_indoor:
+            if zone_weather and connection.zone in zone_weather:
+                rain_prob, uv_index = zone_weather[connection.zone]
             weather_factor = (rain_prob * self.rain_weight) + (uv_index * self.sunny_weight)
             base_cost *= (1.0 + weather_factor)
 
@@ -73,7 +77,8 @@ class PathFinder:
         return base_cost
 
     def find_shortest_path(self, start: int, end: int, rain_prob: float = 0.0,
-                           uv_index: float = 0.0) -> Tuple[List[int], float]:
+                           uv_index: float = 0.0,
+                           zone_weather: Optional[Dict[str, Tuple[float, float]]] = None) -> Tuple[List[int], float]:
         """
         Find the optimal path using Dijkstra's algorithm with custom weights
 
@@ -82,6 +87,8 @@ class PathFinder:
             end: ending vertex index
             rain_prob: probability of rain (0.0-1.0)
             uv_index: UV index (0.0-1.0)
+            zone_weather: optional zone -> (rain_prob, uv_index) overriding the global values
+                          for outdoor connections in that zone
 
         Returns:
             tuple of (path as list of vertices, total cost)
@@ -107,7 +114,7 @@ class PathFinder:
 
             # Check all neighbors
             for neighbor, connection in self.graph[current_vertex]:
-                cost = self._calculate_cost(connection, rain_prob, uv_index)
+                cost = self._calculate_cost(connection, rain_prob, uv_index, zone_weather)
                 distance = current_distance + cost
 
                 # If we've found a better path
@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_stub import WeatherStubServer  # noqa: E402
+from weather_api import WeatherDataCollector  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    with WeatherStubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def collector(stub):
+    collector = WeatherDataCollector(base_url=stub.base_url, timeout=0.3, max_retries=3, backoff_factor=0.01)
+    yield collector
+    collector.close()
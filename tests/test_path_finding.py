@@ -0,0 +1,24 @@
+from map import connections, positions
+from path_finding import PathFinder
+
+
+def test_zone_weather_changes_route():
+    finder = PathFinder(positions, connections)
+
+    clear_path, clear_cost = finder.find_shortest_path(0, 22)
+    rainy_path, rainy_cost = finder.find_shortest_path(0, 22, zone_weather={"west": (1.0, 0.0)})
+
+    assert clear_path[0] == 0 and clear_path[-1] == 22
+    assert 15 in clear_path  # west outdoor route
+    assert 15 not in rainy_path and 28 in rainy_path  # detour through the east zone
+    assert rainy_cost > clear_cost
+
+
+def test_zone_weather_overrides_global_for_zoned_edges():
+    finder = PathFinder(positions, connections)
+    outdoor = next(c for c in connections if not c.is_indoor and c.zone == "east")
+    indoor = next(c for c in connections if c.is_indoor)
+
+    assert finder._calculate_cost(outdoor, 1.0, 1.0, {"east": (0.0, 0.0)}) == finder._calculate_cost(outdoor, 0.0, 0.0)
+    assert finder._calculate_cost(outdoor, 1.0, 1.0, {"west": (0.0, 0.0)}) == finder._calculate_cost(outdoor, 1.0, 1.0)
+    assert finder._calculate_cost(indoor, 0.0, 0.0, {"east": (1.0, 1.0)}) == finder._calculate_cost(indoor, 0.0, 0.0)
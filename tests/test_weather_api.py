@@ -0,0 +1,76 @@
+from weather_api import WeatherDataCollector, WeatherFetchError
+
+
+def test_fetch_success(stub, collector):
+    stub.conditions["Singapore"] = (50, 100, 11)
+
+    data, error = collector.fetch("Singapore")
+
+    assert error is None
+    assert collector.process_weather_metrics(data) == (0.7, 1.0)
+
+
+def test_fetch_http_error_sets_status_code(stub, collector):
+    data, error = collector.fetch("down")
+
+    assert data is None
+    assert isinstance(error, WeatherFetchError)
+    assert error.location == "down"
+    assert error.status_code == 503
+    assert stub.hits["down"] == 4  # first attempt + 3 retries
+
+
+def test_fetch_retries_until_success(stub, collector):
+    data, error = collector.fetch("flaky")
+
+    assert error is None
+    assert data["current_condition"]
+    assert stub.hits["flaky"] == 3
+
+
+def test_fetch_read_timeout(stub):
+    collector = WeatherDataCollector(base_url=stub.base_url, timeout=0.2, max_retries=0)
+
+    data, error = collector.fetch("slow")
+    collector.close()
+
+    assert data is None
+    assert error.location == "slow"
+    assert error.status_code is None
+
+
+def test_fetch_invalid_json(collector):
+    data, error = collector.fetch("bad")
+
+    assert data is None
+    assert error.location == "bad"
+    assert error.status_code is None
+
+
+def test_fetch_many_dedups_locations(stub, collector):
+    results, errors = collector.fetch_many(["a", "b", "a", "down", "a"])
+
+    assert set(results) == {"a", "b"}
+    assert set(errors) == {"down"}
+    assert stub.hits["a"] == 1
+    assert stub.hits["b"] == 1
+
+
+def test_fetch_many_empty(collector):
+    assert collector.fetch_many([]) == ({}, {})
+
+
+def test_get_zone_weather(stub, collector):
+    stub.conditions["1.3,103.6"] = (100, 100, 0)
+
+    zone_weather, zone_errors = collector.get_zone_weather(
+        {"east": "1.3,103.6", "west": "down", "north": "empty"})
+
+    assert zone_weather == {"east": (1.0, 0.0)}
+    assert zone_errors["west"].status_code == 503
+    assert zone_errors["north"].location == "empty"
+    assert "Malformed" in zone_errors["north"].message
+
+
+def test_get_weather_data_returns_none_on_error(collector):
+    assert collector.get_weather_data("down") is None
@@ -0,0 +1,73 @@
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+
+class WeatherStubHandler(BaseHTTPRequestHandler):
+    """
+    Serve canned wttr.in ``format=j1`` responses. The first path segment is the location:
+
+        down   -> always 503
+        flaky  -> 503 for the first two hits, then canned JSON
+        slow   -> canned JSON after ``server.slow_delay`` seconds
+        bad    -> 200 with a body that is not JSON
+        empty  -> 200 with JSON missing ``current_condition``
+        other  -> canned JSON built from ``server.conditions`` (or a mild default)
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        location = unquote(urlparse(self.path).path.strip("/"))
+        with self.server.lock:
+            self.server.hits[location] += 1
+            hits = self.server.hits[location]
+
+        if location == "down" or (location == "flaky" and hits <= 2):
+            self._send(503, b"Service Unavailable")
+        elif location == "bad":
+            self._send(200, b"not json")
+        elif location == "empty":
+            self._send(200, b"{}")
+        else:
+            if location == "slow":
+                time.sleep(self.server.slow_delay)
+            humidity, cloudcover, uv = self.server.conditions.get(location, (0, 0, 0))
+            body = {"current_condition": [{
+                "humidity": str(humidity), "cloudcover": str(cloudcover), "uvIndex": str(uv),
+                "temp_C": "30", "weatherDesc": [{"value": "Stub"}],
+            }]}
+            self._send(200, json.dumps(body).encode())
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class WeatherStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, slow_delay: float = 1.0):
+        super().__init__(("127.0.0.1", 0), WeatherStubHandler)
+        self.slow_delay = slow_delay
+        self.conditions = {}  # location -> (humidity %, cloudcover %, uvIndex 0-11)
+        self.hits = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/{{city}}?format=j1"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
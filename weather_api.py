@@ -1,11 +1,119 @@
 import requests
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import quote
+from urllib3.util.retry import Retry
+
+
+@dataclass
+class WeatherFetchError:
+    location: str
+    message: str
+    status_code: Optional[int] = None  # HTTP status if the server answered
 
 
 class WeatherDataCollector:
-    def __init__(self):
-        """Initialize the weather data collector using wttr.in service"""
-        self.base_url = "https://wttr.in/{city}?format=j1"
+    def __init__(self, base_url: str = "https://wttr.in/{city}?format=j1", timeout: float = 10.0,
+                 max_retries: int = 3, backoff_factor: float = 0.5, max_workers: int = 8):
+        """
+        Initialize the weather data collector using wttr.in service
+
+        Args:
+            base_url: URL template with a {city} placeholder, e.g. a local stub server for testing
+            timeout: per-request timeout in seconds
+            max_retries: retries for connection errors and 429/5xx responses
+            backoff_factor: exponential backoff between retries (seconds)
+            max_workers: number of locations fetched concurrently
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+        # Shared session so connections are pooled and reused across requests
+        retry = Retry(total=max_retries, backoff_factor=backoff_factor,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET",), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def fetch(self, city: str) -> Tuple[Optional[Dict], Optional[WeatherFetchError]]:
+        """
+        Fetch weather data for a single location.
+
+        Args:
+            city (str): City name or "lat,lon" query
+
+        Returns:
+            Tuple[Optional[Dict], Optional[WeatherFetchError]]: (data, None) on success, (None, error) on failure
+        """
+        url = self.base_url.format(city=quote(city, safe=",~"))
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json(), None
+        except requests.exceptions.HTTPError as e:
+            return None, WeatherFetchError(city, str(e), e.response.status_code)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers a body that is not valid JSON
+            return None, WeatherFetchError(city, str(e))
+
+    def fetch_many(self, cities: Iterable[str]) -> Tuple[Dict[str, Dict], Dict[str, WeatherFetchError]]:
+        """
+        Fetch weather data for many locations concurrently over the shared session.
+
+        Args:
+            cities: location queries; duplicates are fetched once
+
+        Returns:
+            Tuple of (location -> weather data, location -> error)
+        """
+        cities = list(dict.fromkeys(cities))
+        results, errors = {}, {}
+        if not cities:
+            return results, errors
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(cities))) as executor:
+            for city, (data, error) in zip(cities, executor.map(self.fetch, cities)):
+                if error is None:
+                    results[city] = data
+                else:
+                    errors[city] = error
+
+        return results, errors
+
+    def get_zone_weather(self, zone_locations: Dict[str, str]) -> Tuple[Dict[str, Tuple[float, float]],
+                                                                         Dict[str, WeatherFetchError]]:
+        """
+        Fetch and normalize (rain chance, UV index) for each weather zone.
+
+        Args:
+            zone_locations: zone name -> location query
+
+        Returns:
+            Tuple of (zone -> (rain chance, UV index), zone -> error). Failed zones are left out of
+            the first dict so PathFinder falls back to the global weather for them.
+        """
+        results, errors = self.fetch_many(zone_locations.values())
+        zone_weather, zone_errors = {}, {}
+        for zone, location in zone_locations.items():
+            if location in results:
+                try:
+                    zone_weather[zone] = self.process_weather_metrics(results[location])
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    zone_errors[zone] = WeatherFetchError(location, f"Malformed weather data: {e!r}")
+            else:
+                zone_errors[zone] = errors[location]
+
+        return zone_weather, zone_errors
 
     def get_weather_data(self, city: str) -> Optional[Dict]:
         """
@@ -17,15 +125,10 @@ class WeatherDataCollector:
         Returns:
             Optional[Dict]: Weather data or None if request fails
         """
-        try:
-            url = self.base_url.format(city=city)
-            response = requests.get(url, headers={'Accept': 'application/json'})
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching weather data: {e}")
-            return None
+        data, error = self.fetch(city)
+        if error is not None:
+            print(f"Error fetching weather data: {error.message}")
+        return data
 
     def process_weather_metrics(self, data: Dict) -> Tuple[float, float]:
         """